@@ -35,7 +35,9 @@ setup(
                              # filelock dropped support for python 3.6 in version 3.4.2 https://github.com/tox-dev/py-filelock/pull/125
                              'filelock<3.4.2' if sys.version_info < (3,7) else 'filelock', ],
     extras_require      =   {'syslog' : ['rfc5424-logging-handler', 'cefevent'],
+                             'fast' : ['orjson'],
                              'docs': ["Sphinx", "recommonmark"], 
-                             'dev': ["pytest", "pytest-cov", "codecov", "coverage", "tox", "mypy"]},
+                             # orjson is required for a deterministic mypy check of wpwatcher.utils
+                             'dev': ["pytest", "pytest-cov", "codecov", "coverage", "tox", "mypy", "orjson"]},
     keywords            =   ABOUT['__keywords__'],
 )
@@ -98,6 +98,18 @@ class T(unittest.TestCase):
             new.update_report(old)
             self.assertEqual(dict(new), dict(expected), "There is an issue with fixed issues feature: the expected report do not match the report returned by update_report()")
 
+    def test_report_defaults_not_shared(self):
+        report = ScanReport(site="exemple.com")
+        report["fixed"].append("This issue was fixed")
+        self.assertEqual(ScanReport(site="exemple2.com")["fixed"], [])
+        self.assertEqual(ScanReport.DEFAULT_REPORT["fixed"], [])
+
+        # Fixed issues of the last report are not modified
+        new = ScanReport(site="exemple.com", datetime="2020-04-10T16-00-00")
+        new.update_report(report)
+        new["fixed"].append("Another issue was fixed")
+        self.assertEqual(report["fixed"], ["This issue was fixed"])
+
     def test_wpscan_output_folder(self):
         RESULTS_FOLDER="./results/"
         WPSCAN_OUTPUT_CONFIG = DEFAULT_CONFIG+"\nwpscan_output_folder=%s"%RESULTS_FOLDER
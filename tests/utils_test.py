@@ -0,0 +1,29 @@
+import unittest
+from datetime import timedelta, datetime
+from wpwatcher.utils import remove_color, parse_timedelta, parse_datetime
+
+class T(unittest.TestCase):
+
+    def test_remove_color(self):
+        self.assertEqual(remove_color("\x1b[31m[!]\x1b[0m Title: \x1b[1;32mPlugin\x1b[0m"), "[!] Title: Plugin")
+        self.assertEqual(remove_color("\x1b[+] stray escape"), "[+] stray escape")
+        # Brackets without escape character are not colors
+        self.assertEqual(remove_color("Fixed in [2m] release"), "Fixed in [2m] release")
+        self.assertEqual(remove_color("No colors"), "No colors")
+
+    def test_parse_timedelta(self):
+        self.assertEqual(parse_timedelta("2d8h5m20s"), timedelta(days=2, hours=8, minutes=5, seconds=20))
+        self.assertEqual(parse_timedelta("1day2hours"), timedelta(days=1, hours=2))
+        self.assertEqual(parse_timedelta("3minutes30seconds"), timedelta(minutes=3, seconds=30))
+        self.assertEqual(parse_timedelta("10min"), timedelta(minutes=10))
+        with self.assertRaisesRegex(ValueError, "Could not parse any time information"):
+            parse_timedelta("tomorrow")
+
+    def test_parse_datetime(self):
+        self.assertEqual(
+            parse_datetime("2020-04-08T16-05-16", "%Y-%m-%dT%H-%M-%S"),
+            datetime(2020, 4, 8, 16, 5, 16),
+        )
+        hits = parse_datetime.cache_info().hits
+        parse_datetime("2020-04-08T16-05-16", "%Y-%m-%dT%H-%M-%S")
+        self.assertEqual(parse_datetime.cache_info().hits, hits + 1)
@@ -1,13 +1,12 @@
 """
 Configuration dict. 
 """
-from typing import Iterable, Tuple, Union, Optional, List, Dict, Any
+from typing import Iterable, Tuple, Union, Optional, List, Dict, Any, Callable
 import configparser
 import os
 import json
 import argparse
 import shlex
-import copy
 import warnings
 from wpwatcher import log
 from wpwatcher.__version__ import __url__
@@ -25,6 +24,8 @@ class Config(Dict[str, Any]):
     If a value is deleted it will probably create a key error using `WPWatcher`.
     """
 
+    __slots__ = ()
+
     # Configuration template -------------------------
     TEMPLATE_FILE: str = """[wpwatcher]
 # WPWatcher configuration file
@@ -141,6 +142,15 @@ smtp_ssl=Yes
 
     FIELDS: Iterable[str] = list(DEFAULT_CONFIG.keys())
 
+    SPECIAL_CLI_ARGS: Dict[str, Callable[[Any], Any]] = {
+        # Urls are list of dict
+        "wp_sites": lambda sites: [{"url": site} for site in sites],
+        "resend_emails_after": parse_timedelta,
+        "daemon_loop_sleep": parse_timedelta,
+        "wpscan_args": shlex.split,
+    }
+    "Converters of the CLI arguments that need a special type"
+
     @classmethod
     def default(cls) -> 'Config':
         """
@@ -239,21 +249,15 @@ smtp_ssl=Yes
 
         # Figuring the config fields that have been overwritten by the args
         # The args must have the same name than the config options.
-        cli_conf_args = {}
-        vars_cli_args = vars(cliargs)
-        for k in vars_cli_args:
-            if k in Config.FIELDS and vars_cli_args[k]:
-                cli_conf_args.update({k: vars_cli_args[k]})
+        cli_conf_args = {
+            k: v for k, v in vars(cliargs).items() if v and k in Config.DEFAULT_CONFIG
+        }
 
         # Append or init list of urls from file if any
         if cliargs.wp_sites_list:
             with open(cliargs.wp_sites_list, "r") as urlsfile:
                 sites = [site.replace("\n", "") for site in urlsfile.readlines()]
-                cli_conf_args["wp_sites"] = (
-                    sites
-                    if "wp_sites" not in cli_conf_args
-                    else cli_conf_args["wp_sites"] + sites
-                )
+                cli_conf_args["wp_sites"] = cli_conf_args.get("wp_sites", []) + sites
 
         cli_conf_args = Config._adjust_special_cli_args(cli_conf_args)
 
@@ -270,10 +274,9 @@ smtp_ssl=Yes
 
     def __repr__(self) -> str:
         """Get the config representation without passwords, ready for printing. """
-        dump_conf = copy.deepcopy(self)
-        string = ""
-        for k in dump_conf:
-            v = dump_conf[k]
+        lines = [""]
+        # Values are not modified in place, no need to copy the config
+        for k, v in self.items():
             if k == "wpscan_args":
                 v = safe_log_wpscan_args(v)
             if k == "smtp_pass" and v != "":
@@ -282,8 +285,8 @@ smtp_ssl=Yes
                 v = json.dumps(v)
             else:
                 v = str(v)
-            string += f"\n{k:<25}\t=\t{v}"
-        return string
+            lines.append(f"{k:<25}\t=\t{v}")
+        return "\n".join(lines)
 
     @staticmethod
     def _adjust_special_cli_args(conf_args: Dict[str, Any]) -> Dict[str, Any]:
@@ -294,24 +297,9 @@ smtp_ssl=Yes
 
         - 'conf_args': Configuration dict with CLI parsed values only
         """
-
-        # Adjust special case of urls that are list of dict
-        if "wp_sites" in conf_args:
-            conf_args["wp_sites"] = [{"url": site} for site in conf_args["wp_sites"]]
-
-        # Adjust special case of resend_emails_after
-        if "resend_emails_after" in conf_args:
-            conf_args["resend_emails_after"] = parse_timedelta(
-                conf_args["resend_emails_after"]
-            )
-        # Adjust special case of daemon_loop_sleep
-        if "daemon_loop_sleep" in conf_args:
-            conf_args["daemon_loop_sleep"] = parse_timedelta(
-                conf_args["daemon_loop_sleep"]
-            )
-        # Adjust special case of wpscan_args
-        if "wpscan_args" in conf_args:
-            conf_args["wpscan_args"] = shlex.split(conf_args["wpscan_args"])
+        for key, convert in Config.SPECIAL_CLI_ARGS.items():
+            if key in conf_args:
+                conf_args[key] = convert(conf_args[key])
         return conf_args
 
     @staticmethod
@@ -445,10 +433,11 @@ smtp_ssl=Yes
         env_loc_exists = False
         # build potential_paths of config file
         for env_var in env_location:
-            if env_var in os.environ:
+            env_loc = os.environ.get(env_var)
+            if env_loc is not None:
                 env_loc_exists = True
                 for file_path in potential_files:
-                    potential_paths.append(os.path.join(os.environ[env_var], file_path))
+                    potential_paths.append(os.path.join(env_loc, file_path))
         if not env_loc_exists:
             raise RuntimeError(f"Cannot find any of the env locations {env_location}. ")
         # If file or folder exist, add to list
@@ -490,10 +479,7 @@ smtp_ssl=Yes
 
         super().__init__(*args, **kwargs)
         # Raise if missing fields
-        missing = []
-        for key in self.FIELDS:
-            if key not in self:
-                missing.append(key)
+        missing = [key for key in self.FIELDS if key not in self]
 
         if missing:
             fields = ", ".join(f"'{key}'" for key in missing)
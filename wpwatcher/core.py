@@ -41,7 +41,7 @@ class WPWatcher:
         watcher = WPWatcher(config)
         exit_code, reports = watcher.run_scans()
         for r in reports:
-            print("%s\t\t%s"%( r['site'], r['status'] ))
+            print(f"{r['site']}\t\t{r['status']}")
     """
 
     # WPWatcher must use a configuration dict
@@ -87,7 +87,8 @@ class WPWatcher:
         """New reports, reset when running `run_scans`."""
 
         # Dump config
-        log.debug(f"Configuration:{repr(conf)}")
+        # Config representation is only built if the message is emitted
+        log.debug("Configuration:%r", conf)
 
     @staticmethod
     def _delete_tmp_wpscan_files() -> None:
@@ -237,7 +238,7 @@ class WPWatcher:
         # Print results and finish
         log.info(repr(self.new_reports))
 
-        if not any([r["status"] == "ERROR" for r in self.new_reports if r]) and not self.scanner.broken_syslog:
+        if not any(r["status"] == "ERROR" for r in self.new_reports if r) and not self.scanner.broken_syslog:
             log.info("Scans finished successfully.")
             return (0, self.new_reports)
         else:
@@ -8,6 +8,7 @@ from wpwatcher.core import WPWatcher
 from wpwatcher.config import Config
 from wpwatcher.report import ScanReport
 from wpwatcher.site import Site
+from wpwatcher.utils import parse_datetime
 
 from filelock import FileLock, Timeout
 
@@ -80,7 +81,7 @@ class WPWatcherDaemonMode(WPWatcher):
         """Return true if the daemon mode is enabled and scan already happend in the last configured `daemon_loop_wait`"""
         if (
             datetime.now()
-            - datetime.strptime(last_wp_report["datetime"], DATE_FORMAT)
+            - parse_datetime(last_wp_report["datetime"], DATE_FORMAT)
             < self._daemon_loop_sleep
         ):
             log.info(
@@ -5,11 +5,11 @@ Interface to JSON file storing scan results.
 from typing import Iterable, List, Dict, Any, Optional
 import os
 import json
-import time
 import threading
 from wpwatcher import log
 from wpwatcher.config import Config
 from wpwatcher.report import ScanReport, ReportCollection
+from wpwatcher.utils import json_loads
 
 from filelock import FileLock, Timeout
 
@@ -38,6 +38,11 @@ class DataBase:
         self._data = ReportCollection()
         self._data.extend(self._build_db(self.filepath))
 
+        # Position of the reports in self._data by site
+        self._index: Dict[str, int] = {}
+        for i, r in enumerate(self._data):
+            self._index.setdefault(r["site"], i)
+
         # Writing into the database file is thread safe
         self._wp_report_lock: threading.Lock = threading.Lock()
 
@@ -90,7 +95,7 @@ class DataBase:
             try:
                 with open(filepath, "r") as reportsfile:
                     wp_reports.extend(
-                        ScanReport(item) for item in json.load(reportsfile)
+                        ScanReport(item) for item in json_loads(reportsfile.read())
                     )
                 log.info(f"Load wp_reports database: {filepath}")
             except Exception:
@@ -117,36 +122,26 @@ class DataBase:
         if not wp_reports:
             wp_reports = self._data
 
-        for newr in wp_reports:
-            new = True
-            for r in self._data:
-                if r["site"] == newr["site"]:
-                    self._data[self._data.index(r)] = newr
-                    new = False
-                    break
-            if new:
-                self._data.append(newr)
-        # Write to file if not null
-        if not self.no_local_storage:
-            # Write method thread safe
-            while self._wp_report_lock.locked():
-                time.sleep(0.01)
-            self._wp_report_lock.acquire()
-            with open(self.filepath, "w") as reportsfile:
-                json.dump(self._data, reportsfile, indent=4)
-                self._wp_report_lock.release()
-            return True
-        else:
-            return False
+        # Write method thread safe, the lock is released even if dump fails
+        with self._wp_report_lock:
+            for newr in wp_reports:
+                index = self._index.get(newr["site"])
+                if index is None:
+                    self._index[newr["site"]] = len(self._data)
+                    self._data.append(newr)
+                else:
+                    self._data[index] = newr
+            # Write to file if not null
+            if not self.no_local_storage:
+                with open(self.filepath, "w") as reportsfile:
+                    json.dump(self._data, reportsfile, indent=4)
+                return True
+            else:
+                return False
 
     def find(self, wp_report: ScanReport) -> Optional[ScanReport]:
         """
         Find the pre-existing report if any.
         """
-        last_wp_reports = [r for r in self._data if r["site"] == wp_report["site"]]
-        last_wp_report: Optional[ScanReport]
-        if len(last_wp_reports) > 0:
-            last_wp_report = last_wp_reports[0]
-        else:
-            last_wp_report = None
-        return last_wp_report
+        index = self._index.get(wp_report["site"])
+        return self._data[index] if index is not None else None
@@ -3,19 +3,18 @@ Email notifications.
 """
 from typing import Dict, Any, List, Optional
 import io
-import re
 import smtplib
 import threading
 import time
 from string import Template
-from datetime import datetime, timedelta
+from datetime import timedelta
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from wpscan_out_parse.formatter import format_results, format_issues
 from wpwatcher import log
 from wpwatcher.__version__ import __version__
-from wpwatcher.utils import get_valid_filename
+from wpwatcher.utils import get_valid_filename, remove_color, parse_datetime
 
 # Date format used everywhere
 DATE_FORMAT = "%Y-%m-%dT%H-%M-%S"
@@ -107,9 +106,7 @@ class EmailSender:
         # Attachment log if attach_wpscan_output
         if self.attach_wpscan_output:
             # Remove color
-            wp_report["wpscan_output"] = re.sub(
-                r"(\x1b|\[[0-9][0-9]?m)", "", str(wp_report["wpscan_output"])
-            )
+            wp_report["wpscan_output"] = remove_color(str(wp_report["wpscan_output"]))
             # Read the WPSCan output
             attachment = io.BytesIO(wp_report["wpscan_output"].encode())
             part = MIMEApplication(attachment.read(), Name="WPScan_output")
@@ -137,16 +134,19 @@ class EmailSender:
         if not wp_report:
             return False
 
+        # Status is computed on every access, get it once
+        status = wp_report["status"]
+
         # Return if email seding is disable
         if not self.send_email_report:
             # No report notice
             log.info(
-                f"Not sending WPWatcher {wp_report['status']} email report for site {wp_report['site']}. To receive emails, setup mail server settings in the config and enable send_email_report or use --send."
+                f"Not sending WPWatcher {status} email report for site {wp_report['site']}. To receive emails, setup mail server settings in the config and enable send_email_report or use --send."
             )
             should = False
 
         # Return if error email and disabled
-        elif wp_report["status"] == "ERROR" and not self.send_errors:
+        elif status == "ERROR" and not self.send_errors:
             log.info(
                 f"Not sending WPWatcher ERROR email report for site {wp_report['site']} because send_errors=No. If you want to receive error emails, set send_errors=Yes in the config or use --errors."
             )
@@ -154,7 +154,7 @@ class EmailSender:
 
         # Regular mail filter with --warnings or --infos
         elif (
-            wp_report["status"] == "WARNING"
+            status == "WARNING"
             and not self.send_warnings
             and not self.send_infos
         ):
@@ -163,7 +163,7 @@ class EmailSender:
             )
             should = False
 
-        elif wp_report["status"] == "INFO" and not self.send_infos:
+        elif status == "INFO" and not self.send_infos:
             # No report notice
             log.info(
                 f"Not sending WPWatcher INFO email report for site {wp_report['site']} because send_infos=No. If you want to receive infos emails, set send_infos=Yes in the config or use --infos."
@@ -173,14 +173,14 @@ class EmailSender:
         if last_wp_report is not None:
           if (
               last_wp_report["last_email"] is not None
-              and datetime.strptime(wp_report["datetime"], DATE_FORMAT)
-                - datetime.strptime(last_wp_report["last_email"], DATE_FORMAT)
+              and parse_datetime(wp_report["datetime"], DATE_FORMAT)
+                - parse_datetime(last_wp_report["last_email"], DATE_FORMAT)
                 < self.resend_emails_after
-              and last_wp_report["status"] == wp_report["status"]
+              and last_wp_report["status"] == status
           ):
               # No report notice
               log.info(
-                  f"Not sending WPWatcher {wp_report['status']} email report for site {wp_report['site']} because already sent in the last {self.resend_emails_after}."
+                  f"Not sending WPWatcher {status} email report for site {wp_report['site']} because already sent in the last {self.resend_emails_after}."
               )
               should = False
 
@@ -190,15 +190,16 @@ class EmailSender:
         self, wp_site: Dict[str, Any], wp_report: Dict[str, Any], wpscan_command: str, wpscan_version:str
     ) -> bool:
         """Sending the report"""
+        status = wp_report["status"]
         # Send the report to
-        if len(self.email_errors_to) > 0 and wp_report["status"] == "ERROR":
+        if len(self.email_errors_to) > 0 and status == "ERROR":
             to = self.email_errors_to
         else:
             to = wp_site["email_to"] + self.email_to
 
         if not to:
             log.info(
-                f"Not sending WPWatcher {wp_report['status']} email report because no email is configured for site {wp_report['site']}"
+                f"Not sending WPWatcher {status} email report because no email is configured for site {wp_report['site']}"
             )
             return False
 
@@ -213,19 +214,18 @@ class EmailSender:
     def build_message(wp_report: Dict[str, Any], wpscan_command: str, wpscan_version:str) -> str:
         """Build mail message text base on report and warnngs and info switch"""
 
-        message = (
-            f"<p>WordPress security scan report for site: {wp_report['site']}<br />\n"
-        )
-        message += f"Scan datetime: {wp_report['datetime']}<br />\n<p>"
-
-        message += format_results(wp_report, format="html")
+        parts = [
+            f"<p>WordPress security scan report for site: {wp_report['site']}<br />\n",
+            f"Scan datetime: {wp_report['datetime']}<br />\n<p>",
+            format_results(wp_report, format="html"),
+        ]
 
         if wp_report["fixed"]:
-            message += "<br/>\n"
-            message += format_issues("Fixed", wp_report["fixed"], format="html")
+            parts.append("<br/>\n")
+            parts.append(format_issues("Fixed", wp_report["fixed"], format="html"))
 
         return TEMPLATE_EMAIL.substitute(
-            content=message,
+            content="".join(parts),
             wpwatcher_version=__version__,
             wpscan_command=wpscan_command,
             wpscan_version=wpscan_version
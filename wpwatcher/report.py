@@ -3,8 +3,21 @@ Containers for scan results data stucture.
 """
 
 from typing import Dict, Any, List, Iterable, Tuple, Optional, overload
+import re
+import copy
 from wpwatcher import log
 from wpscan_out_parse.parser.base import Parser
+
+# Line boundaries, as recognized by str.splitlines()
+_LINE_BREAK_RE = re.compile("[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def _first_line(text: str) -> str:
+    """Like ``text.splitlines()[0]`` but do not split the whole text"""
+    match = _LINE_BREAK_RE.search(text)
+    return text[: match.start()] if match else text
+
+
 class ScanReport(Dict[str, Any]):
     """
     Dict-Like object to store and process scan results.
@@ -26,6 +39,9 @@ class ScanReport(Dict[str, Any]):
 
     """
 
+    # No per-instance __dict__, data is stored in the dict itself
+    __slots__ = ()
+
     DEFAULT_REPORT: Dict[str, Any] = {
         "site": "",
         "status": "",
@@ -45,17 +61,17 @@ class ScanReport(Dict[str, Any]):
 
     def __init__(self, *args, **kwargs) -> None:  # type: ignore [no-untyped-def]
         super().__init__(*args, **kwargs)
-        for key in self.FIELDS:
-            self.setdefault(key, self.DEFAULT_REPORT[key])
+        for key, default in self.DEFAULT_REPORT.items():
+            # Copy the default so mutable values are not shared between instances
+            self.setdefault(key, copy.copy(default))
 
     def fail(self, reason: str) -> None:
         """
         Mark the scan as failed. 
         """
         log.error(reason)
-        if self["error"]:
-            self["error"] += "\n\n"
-        self["error"] += reason
+        error = self["error"]
+        self["error"] = f"{error}\n\n{reason}" if error else reason
 
     def load_parser(self, parser: Parser) -> None:
         """
@@ -92,13 +108,13 @@ class ScanReport(Dict[str, Any]):
 
     def status(self) -> str:
         """Get report status. """
-        status = ""
-        if len(self["error"]) > 0:
+        # dict.get() does not go through the __getitem__ override
+        if self.get("error"):
             status = "ERROR"
-        elif len(self["warnings"]) > 0 and len(self["alerts"]) == 0:
-            status = "WARNING"
-        elif len(self["alerts"]) > 0:
+        elif self.get("alerts"):
             status = "ALERT"
+        elif self.get("warnings"):
+            status = "WARNING"
         else:
             status = "INFO"
         self['status'] = status
@@ -110,7 +126,7 @@ class ScanReport(Dict[str, Any]):
         """
         if last_wp_report:
             # Save already fixed issues but not reported yet
-            self["fixed"] = last_wp_report["fixed"]
+            self["fixed"] = list(last_wp_report["fixed"])
 
             # Fill out last_email datetime if any
             if last_wp_report["last_email"]:
@@ -118,79 +134,89 @@ class ScanReport(Dict[str, Any]):
 
             # Fill out fixed issues if the scan is not an error
             if self["status"] != "ERROR":
-                fixed, unfixed = self._get_fixed_n_unfixed_issues(
-                    last_wp_report, issue_type="alerts"
-                )
-                self["fixed"].extend(fixed)
-                self._add_unfixed_warnings(
-                    last_wp_report, unfixed, issue_type="alerts"
-                )
-
-                fixed, unfixed = self._get_fixed_n_unfixed_issues(
-                    last_wp_report, issue_type="warnings"
-                )
-                self["fixed"].extend(fixed)
-                self._add_unfixed_warnings(
-                    last_wp_report, unfixed, issue_type="warnings"
-                )
+                for issue_type in ("alerts", "warnings"):
+                    # Index the current issues once for both passes
+                    issue_indexes = self._index_components(self[issue_type])
+                    fixed, unfixed = self._get_fixed_n_unfixed_issues(
+                        last_wp_report, issue_type, issue_indexes
+                    )
+                    self["fixed"].extend(fixed)
+                    self._add_unfixed_warnings(
+                        last_wp_report, unfixed, issue_type, issue_indexes
+                    )
 
     def _add_unfixed_warnings(
         self,
         last_wp_report: 'ScanReport',
         unfixed_items: List[str],
         issue_type: str,
+        issue_indexes: Dict[str, int],
     ) -> None:
         """
         A line will be added at the end of the warning like:
         "This issue is unfixed since {date}"
+
+        `issue_indexes` is the index of current issues returned by `_index_components`.
         """
 
+        issues = self[issue_type]
+        older_issues = last_wp_report[issue_type]
+        older_issue_indexes = self._index_components(older_issues)
+
         for unfixed_item in unfixed_items:
-            try:
-                # Get unfixd issue
-                issue_index = [
-                    alert.splitlines()[0] for alert in self[issue_type]
-                ].index(unfixed_item.splitlines()[0])
-            except ValueError as e:
-                log.error(e)
+            component = _first_line(unfixed_item)
+            # Get unfixd issue
+            issue_index = issue_indexes.get(component)
+            if issue_index is None:
+                log.error(f"{component!r} is not in list")
+                continue
+            # Try to get older issue if it exists
+            older_issue_index = older_issue_indexes.get(component)
+            if older_issue_index is None:
+                log.error(f"{component!r} is not in list")
+                unfixed_line = ""
             else:
-                self[issue_type][issue_index] += "\n"
-                try:
-                    # Try to get older issue if it exists
-                    older_issue_index = [
-                        alert.splitlines()[0] for alert in last_wp_report[issue_type]
-                    ].index(unfixed_item.splitlines()[0])
-                except ValueError as e:
-                    log.error(e)
+                older_warn_last_line = older_issues[older_issue_index].splitlines()[-1]
+                if "This issue is unfixed" in older_warn_last_line:
+                    unfixed_line = older_warn_last_line
                 else:
-                    older_warn_last_line = last_wp_report[issue_type][
-                        older_issue_index
-                    ].splitlines()[-1]
-                    if "This issue is unfixed" in older_warn_last_line:
-                        self[issue_type][issue_index] += older_warn_last_line
-                    else:
-                        self[issue_type][
-                            issue_index
-                        ] += f"This issue is unfixed since {last_wp_report['datetime']}"
+                    unfixed_line = f"This issue is unfixed since {last_wp_report['datetime']}"
+            # Build the new issue text at once
+            issues[issue_index] = f"{issues[issue_index]}\n{unfixed_line}"
+
+    @staticmethod
+    def _index_components(issues: List[str]) -> Dict[str, int]:
+        """Map the component (first line) of the issues to the index of its first occurrence"""
+        indexes: Dict[str, int] = {}
+        for i, issue in enumerate(issues):
+            indexes.setdefault(_first_line(issue), i)
+        return indexes
 
     def _get_fixed_n_unfixed_issues(
-        self, last_wp_report: 'ScanReport', issue_type: str
+        self, last_wp_report: 'ScanReport', issue_type: str,
+        issue_indexes: Dict[str, int],
     ) -> Tuple[List[str], List[str]]:
         """Return list of fixed issue texts to include in mails"""
-        fixed_issues = []
-        unfixed_issues = []
-        for last_alert in last_wp_report[issue_type]:
-            if (self["wpscan_parser"] and 
-            not self["wpscan_parser"].is_false_positive(last_alert) ):
-
-                if last_alert.splitlines()[0] not in [
-                    alert.splitlines()[0] for alert in self[issue_type]
-                ]:
-                    fixed_issues.append(
-                        f'Issue regarding component "{last_alert.splitlines()[0]}" has been fixed since the last scan.'
-                    )
-                else:
-                    unfixed_issues.append(last_alert)
+        fixed_issues: List[str] = []
+        unfixed_issues: List[str] = []
+        parser = self["wpscan_parser"]
+        if not parser:
+            return fixed_issues, unfixed_issues
+
+        # Filter out false positives of the last report in one pass
+        is_false_positive = parser.is_false_positive
+        last_issues = [
+            issue for issue in last_wp_report[issue_type]
+            if not is_false_positive(issue)
+        ]
+        for last_alert in last_issues:
+            component = _first_line(last_alert)
+            if component not in issue_indexes:
+                fixed_issues.append(
+                    f'Issue regarding component "{component}" has been fixed since the last scan.'
+                )
+            else:
+                unfixed_issues.append(last_alert)
 
         return fixed_issues, unfixed_issues
 
@@ -200,6 +226,8 @@ class ReportCollection(List[ScanReport]):
     List-Like object to store reports. 
     """
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         """
         Get the summary string.
@@ -210,7 +238,7 @@ class ReportCollection(List[ScanReport]):
         results = [ item for item in self if item ] 
         if not results:
             return "No scan report to show"
-        string = "Scan reports summary\n"
+        lines = ["Scan reports summary"]
         header = (
             "Site",
             "Status",
@@ -223,27 +251,27 @@ class ReportCollection(List[ScanReport]):
         # Determine the longest width for site column
         for r in results:
             sites_w = len(r["site"]) + 4 if r and len(r["site"]) > sites_w else sites_w
-        frow = "{:<%d} {:<8} {:<20} {:<20} {:<8} {}" % sites_w
-        string += frow.format(*header)
+
+        # Row template: Site, Status, Last scan, Last email, Issues, Problematic component(s)
+        frow = f"{{:<{sites_w}}} {{:<8}} {{:<20}} {{:<20}} {{:<8}} {{}}"
+        lines.append(frow.format(*header))
         for row in results:
-            pb_components = []
-            for m in row["alerts"] + row["warnings"]:
-                pb_components.append(m.splitlines()[0])
+            issues = row["alerts"] + row["warnings"]
+            pb_components = [_first_line(m) for m in issues]
             # 'errors' key is deprecated.
-            if row.get("error", None) or row.get("errors", []):
-                err = row.get("error", "").splitlines()
+            if row.get("error", None) or row.get("errors", ()):
+                err = row.get("error", "")
                 if err:
-                    pb_components.append(err[0])
+                    pb_components.append(_first_line(err))
                 # 'errors' key is deprecated, this part would be removed in the future
-                for m in row.get("errors", []):
-                    pb_components.append(m.splitlines()[0])
-            string += "\n"
-            string += frow.format(
+                for m in row.get("errors", ()):
+                    pb_components.append(_first_line(m))
+            lines.append(frow.format(
                 str(row["site"]),
                 str(row["status"]),
                 str(row["datetime"]),
                 str(row["last_email"]),
-                len(row["alerts"] + row["warnings"]),
+                len(issues),
                 ", ".join(pb_components),
-            )
-        return string
+            ))
+        return "\n".join(lines)
@@ -3,10 +3,10 @@ Scanner utility.
 """
 from typing import Optional, BinaryIO, List, Tuple, Dict, Any, Union
 import threading
+import logging
 import re
 import os
 import traceback
-import json
 from smtplib import SMTPException
 from datetime import timedelta, datetime
 
@@ -19,9 +19,10 @@ from wpwatcher.utils import (
     safe_log_wpscan_args,
     oneline,
     remove_color,
+    json_loads,
 )
 from wpwatcher.email import EmailSender
-from wpwatcher.wpscan import WPScanWrapper
+from wpwatcher.wpscan import WPScanWrapper, SUCCESS_EXIT_CODES, CANCELLED_EXIT_CODES
 from wpwatcher.syslog import SyslogOutput
 from wpwatcher.report import ScanReport
 from wpwatcher.site import Site
@@ -35,6 +36,9 @@ DATE_FORMAT = "%Y-%m-%dT%H-%M-%S"
 class Scanner:
     """Scanner class create reports and handles the scan process. """
 
+    OUTPUT_SUBFOLDERS: Tuple[str, ...] = ("error/", "alert/", "warning/", "info/")
+    "Subfolders of `wpscan_output_folder`, one per report status"
+
     def __init__(self, conf: Config):
 
         # Create (lazy) wpscan link
@@ -58,19 +62,13 @@ class Scanner:
         self.fail_fast: bool = conf["fail_fast"]
         self.false_positive_strings: List[str] = conf["false_positive_strings"]
 
-        # Init wpscan output folder
+        # Init wpscan output folder and one subfolder per report status
         if self.wpscan_output_folder:
             os.makedirs(self.wpscan_output_folder, exist_ok=True)
-            os.makedirs(
-                os.path.join(self.wpscan_output_folder, "error/"), exist_ok=True
-            )
-            os.makedirs(
-                os.path.join(self.wpscan_output_folder, "alert/"), exist_ok=True
-            )
-            os.makedirs(
-                os.path.join(self.wpscan_output_folder, "warning/"), exist_ok=True
-            )
-            os.makedirs(os.path.join(self.wpscan_output_folder, "info/"), exist_ok=True)
+            for folder in self.OUTPUT_SUBFOLDERS:
+                os.makedirs(
+                    os.path.join(self.wpscan_output_folder, folder), exist_ok=True
+                )
 
         self.syslog: Optional[SyslogOutput] = None
         self.broken_syslog = False
@@ -126,14 +124,26 @@ class Scanner:
     
     def log_report_results(self, wp_report: ScanReport) -> None:
         """Print WPScan findings"""
-        for info in wp_report["infos"]:
-            log.info(oneline(f"** WPScan INFO {wp_report['site']} ** {info}"))
-        for fix in wp_report["fixed"]:
-            log.info(oneline(f"** FIXED Issue {wp_report['site']} ** {fix}"))
-        for warning in wp_report["warnings"]:
-            log.warning(oneline(f"** WPScan WARNING {wp_report['site']} ** {warning}"))
+        site = wp_report["site"]
+        # Skip formatting messages that would not be logged (i.e. quiet mode)
+        if log.isEnabledFor(logging.INFO):
+            prefix = f"** WPScan INFO {site} ** "
+            for info in wp_report["infos"]:
+                log.info(oneline(prefix + info))
+            prefix = f"** FIXED Issue {site} ** "
+            for fix in wp_report["fixed"]:
+                log.info(oneline(prefix + fix))
+        if log.isEnabledFor(logging.WARNING):
+            prefix = f"** WPScan WARNING {site} ** "
+            for warning in wp_report["warnings"]:
+                log.warning(oneline(prefix + warning))
+        prefix = f"** WPScan ALERT {site} ** "
         for alert in wp_report["alerts"]:
-            log.critical(oneline(f"** WPScan ALERT {wp_report['site']} ** {alert}"))
+            log.critical(oneline(prefix + alert))
+
+    def _wpscan_arguments(self, wp_site: Site) -> List[str]:
+        """Global and site specific WPScan arguments followed by the site URL"""
+        return [*self.wpscan_args, *wp_site["wpscan_args"], "--url", wp_site["url"]]
 
     def _scan_site(
         self, wp_site: Site, wp_report: ScanReport
@@ -145,9 +155,7 @@ class Scanner:
         """
 
         # WPScan arguments
-        wpscan_arguments = (
-            self.wpscan_args + wp_site["wpscan_args"] + ["--url", wp_site["url"]]
-        )
+        wpscan_arguments = self._wpscan_arguments(wp_site)
 
         # Output
         log.info(f"Scanning site {wp_site['url']}")
@@ -158,24 +166,30 @@ class Scanner:
         )
         wp_report["wpscan_output"] = wpscan_process.stdout
 
-        log.debug(f"WPScan raw output:\n{wp_report['wpscan_output']}")
+        log.debug("WPScan raw output:\n%s", wp_report["wpscan_output"])
         log.debug("Parsing WPScan output")
 
+        # Build the false positive strings once per site, without duplicates:
+        # the parser checks every string against every message.
+        false_positive_strings = list(
+            dict.fromkeys(
+                self.false_positive_strings
+                + wp_site["false_positive_strings"]
+                + ["No WPVulnDB API Token given", "No WPScan API Token given"]
+            )
+        )
+
         try:
             # Use wpscan_out_parse module
             try:
                 parser = WPScanJsonParser(
-                    json.loads(wp_report["wpscan_output"]),
-                    self.false_positive_strings
-                    + wp_site["false_positive_strings"] 
-                    + ["No WPVulnDB API Token given", "No WPScan API Token given"]
+                    json_loads(wp_report["wpscan_output"]),
+                    false_positive_strings
                 )
             except ValueError as err:
                 parser = WPScanCliParser(
                     wp_report["wpscan_output"],
-                    self.false_positive_strings
-                    + wp_site["false_positive_strings"]
-                    + ["No WPVulnDB API Token given", "No WPScan API Token given"]
+                    false_positive_strings
                 )
             finally:
                 wp_report.load_parser(parser)
@@ -186,11 +200,11 @@ class Scanner:
             ) from err
 
         # Exit code 0: all ok. Exit code 5: Vulnerable. Other exit code are considered as errors
-        if wpscan_process.returncode in [0, 5]:
+        if wpscan_process.returncode in SUCCESS_EXIT_CODES:
             return wp_report
 
         # Quick return if interrupting and/or if user cancelled scans
-        if self.interrupting or wpscan_process.returncode in [2, -2, -9]:
+        if self.interrupting or wpscan_process.returncode in CANCELLED_EXIT_CODES:
             return None
 
         # Other errors codes : 127, etc, simply raise error
@@ -244,12 +258,7 @@ class Scanner:
         self.log_report_results(wp_report)
 
         wpscan_command = " ".join(
-            safe_log_wpscan_args(
-                ["wpscan"]
-                + self.wpscan_args
-                + wp_site["wpscan_args"]
-                + ["--url", wp_site["url"]]
-            )
+            safe_log_wpscan_args(["wpscan", *self._wpscan_arguments(wp_site)])
         )
 
         try:
@@ -288,12 +297,10 @@ class Scanner:
         self.scanned_sites.append(wp_site["url"])
 
         # Discard wpscan_output from report
-        if "wpscan_output" in wp_report:
-            del wp_report["wpscan_output"]
+        wp_report.pop("wpscan_output", None)
 
         # Discard wpscan_parser from report
-        if "wpscan_parser" in wp_report:
-            del wp_report["wpscan_parser"]
+        wp_report.pop("wpscan_parser", None)
 
 
         return wp_report
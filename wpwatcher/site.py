@@ -3,6 +3,7 @@ Container for a website to be scanned.
 """
 
 from urllib.parse import urlparse
+import copy
 from typing import Iterable, Dict, Any
 
 
@@ -15,6 +16,8 @@ class Site(Dict[str, Any]):
     
     """
 
+    __slots__ = ()
+
     DEFAULT_SITE: Dict[str, Any] = {
         "url": "",
         "email_to": [],
@@ -37,5 +40,5 @@ class Site(Dict[str, Any]):
             if p_url[0] == "":
                 self["url"] = f"http://{self['url']}"
 
-        for key in self.FIELDS:
-            self.setdefault(key, self.DEFAULT_SITE[key])
+        for key, default in self.DEFAULT_SITE.items():
+            self.setdefault(key, copy.copy(default))
@@ -55,9 +55,12 @@ class SyslogOutput:
         from cefevent import CEFEvent
 
         messages = []
-        for v in self.EVENTS.keys():
-            # make sure items is a list, cast error string to list
-            items = wp_report[v] if isinstance(wp_report[v], list) else [wp_report[v]]
+        # Same for every message of the report
+        source_host_name = wp_report["site"][:1022]
+        for v, (signature_id, name, severity) in self.EVENTS.items():
+            # make sure items is a list, wrap error string in a tuple
+            value = wp_report[v]
+            items = value if isinstance(value, list) else (value,)
             for msg_data in items:
                 if msg_data:
                     log.debug(f"Message data: {msg_data}")
@@ -67,12 +70,12 @@ class SyslogOutput:
                     c.set_prefix("deviceProduct", self.DEVICE_PRODUCT)
                     c.set_prefix("deviceVersion", self.DEVICE_VERSION)
                     # Message common fields
-                    c.set_prefix("signatureId", self.EVENTS[v][0])
-                    c.set_prefix("name", self.EVENTS[v][1])
-                    c.set_prefix("severity", self.EVENTS[v][2])
+                    c.set_prefix("signatureId", signature_id)
+                    c.set_prefix("name", name)
+                    c.set_prefix("severity", severity)
                     # Message supp infos
                     c.set_field("message", msg_data[:1022])
-                    c.set_field("sourceHostName", wp_report["site"][:1022])
+                    c.set_field("sourceHostName", source_host_name)
                     msg = c.build_cef()
                     log.debug(f"Message CEF: {msg}")
                     messages.append(msg)
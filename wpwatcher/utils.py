@@ -5,20 +5,57 @@ from typing import Iterable, Optional, Tuple, Dict, Any, Callable, List
 import re
 import threading
 import sys
-import copy
 import threading
 import queue
-from datetime import timedelta
+import functools
+from datetime import timedelta, datetime
 from wpwatcher import log
 
+try:
+    # Use faster JSON decoder if available
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore [assignment]
+
 # Few static helper methods -------------------
 
+# ANSI color sequences (and stray escape characters)
+_ANSI_COLOR_RE = re.compile(r"\x1b(\[[0-9;]*m)?")
+
 
 def remove_color(string: str) -> str:
     """
     Remove ansi colors from string.
     """
-    return re.sub(r"(\x1b|\[[0-9][0-9]?m)", "", string)
+    if "\x1b" not in string:
+        return string
+    return _ANSI_COLOR_RE.sub("", string)
+
+
+class _FuncThread(threading.Thread):
+    """Thread storing the result or the exception of func, used by `timeout`."""
+
+    def __init__(
+        self,
+        bucket: queue.Queue,  # type: ignore [type-arg]
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        threading.Thread.__init__(self)
+        self.result: Any = None
+        self.bucket: queue.Queue = bucket  # type: ignore [type-arg]
+        self.err: Optional[Exception] = None
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self) -> None:
+        try:
+            self.result = self._func(*self._args, **self._kwargs)
+        except Exception as err:
+            self.bucket.put(sys.exc_info())
+            self.err = err
 
 
 def timeout(
@@ -32,22 +69,8 @@ def timeout(
     :raise TimeoutError: If func didn't finish running within the given timeout.
     """
 
-    class FuncThread(threading.Thread):
-        def __init__(self, bucket: queue.Queue) -> None:  # type: ignore [type-arg]
-            threading.Thread.__init__(self)
-            self.result: Any = None
-            self.bucket: queue.Queue = bucket  # type: ignore [type-arg]
-            self.err: Optional[Exception] = None
-
-        def run(self) -> None:
-            try:
-                self.result = func(*args, **kwargs)
-            except Exception as err:
-                self.bucket.put(sys.exc_info())
-                self.err = err
-
     bucket: queue.Queue = queue.Queue()  # type: ignore [type-arg]
-    it = FuncThread(bucket)
+    it = _FuncThread(bucket, func, args, kwargs)
     it.start()
     it.join(timeout)
     if it.is_alive():
@@ -63,7 +86,7 @@ def timeout(
 
 def safe_log_wpscan_args(wpscan_args: Iterable[str]) -> List[str]:
     """Replace `--api-token` param with `"***"` for safer logging"""
-    args = [val.strip() for val in copy.deepcopy(wpscan_args)]
+    args = [val.strip() for val in wpscan_args]
     if "--api-token" in args:
         args[args.index("--api-token") + 1] = "***"
     return args
@@ -89,30 +112,44 @@ def print_progress_bar(count: int, total: int) -> None:
     )
 
 
+# Time units aliases and their symbol
+_TIME_UNITS: Dict[str, str] = {
+    "sec": "s",
+    "second": "s",
+    "seconds": "s",
+    "minute": "m",
+    "minutes": "m",
+    "min": "m",
+    "mn": "m",
+    "days": "d",
+    "day": "d",
+    "hours": "h",
+    "hour": "h",
+}
+# Longest aliases first so "seconds" is not matched as "sec"
+_TIME_UNITS_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_TIME_UNITS, key=len, reverse=True))
+)
+_TIMEDELTA_RE = re.compile(
+    r"^((?P<days>[\.\d]+?)d)?((?P<hours>[\.\d]+?)h)?((?P<minutes>[\.\d]+?)m)?((?P<seconds>[\.\d]+?)s)?$"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_datetime(date_string: str, date_format: str) -> datetime:
+    """
+    Cached `datetime.strptime`: the same report dates are parsed
+    again and again, on every email check and daemon loop.
+    """
+    return datetime.strptime(date_string, date_format)
+
+
 def parse_timedelta(time_str: str) -> timedelta:
     """
     Parse a time string e.g. (2h13m) into a timedelta object.  Stolen on the web
     """
-    regex = re.compile(
-        r"^((?P<days>[\.\d]+?)d)?((?P<hours>[\.\d]+?)h)?((?P<minutes>[\.\d]+?)m)?((?P<seconds>[\.\d]+?)s)?$"
-    )
-    time_str = replace(
-        time_str,
-        {
-            "sec": "s",
-            "second": "s",
-            "seconds": "s",
-            "minute": "m",
-            "minutes": "m",
-            "min": "m",
-            "mn": "m",
-            "days": "d",
-            "day": "d",
-            "hours": "h",
-            "hour": "h",
-        },
-    )
-    parts = regex.match(time_str)
+    time_str = _TIME_UNITS_RE.sub(lambda m: _TIME_UNITS[m.group(0)], time_str)
+    parts = _TIMEDELTA_RE.match(time_str)
     if parts is None:
         raise ValueError(
             f"Could not parse any time information from '{time_str}'.  Examples of valid strings: '8h', '2d8h5m20s', '2m4s'"
@@ -121,12 +158,3 @@ def parse_timedelta(time_str: str) -> timedelta:
         name: float(param) for name, param in parts.groupdict().items() if param
     }
     return timedelta(**time_params)
-
-
-def replace(text: str, conditions: Dict[str, str]) -> str:
-    """Multiple replacements helper method.  Stolen on the web"""
-    rep = conditions
-    rep = dict((re.escape(k), rep[k]) for k in rep)
-    pattern = re.compile("|".join(rep.keys()))
-    text = pattern.sub(lambda m: rep[re.escape(m.group(0))], text)
-    return text
@@ -1,7 +1,8 @@
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, FrozenSet
 import shlex
 import subprocess
 import json
+import logging
 import time
 import re
 import threading
@@ -20,6 +21,17 @@ UPDATE_DB_INTERVAL: timedelta = timedelta(hours=1)
 INTERRUPT_TIMEOUT: int = 5
 "Send kill signal after 5 seconds when interrupting."
 
+SUCCESS_EXIT_CODES: FrozenSet[int] = frozenset({0, 5})
+"WPScan exit codes of completed scans: 0 (all ok) and 5 (vulnerable)."
+
+CANCELLED_EXIT_CODES: FrozenSet[int] = frozenset({2, -2, -9})
+"WPScan exit codes when the scan was cancelled or killed."
+
+# URLs in WPScan output
+_URL_RE = re.compile(
+    r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+)
+
 # WPScan helper class -----------
 class WPScanWrapper:
     """
@@ -74,7 +86,7 @@ class WPScanWrapper:
                 if self._needs_update():  # Re-check in case of concurrent scanning
                     self._update_wpscan()
         p = self._wpscan(*args)
-        if p.returncode not in [0, 5]:
+        if p.returncode not in SUCCESS_EXIT_CODES:
             return self._handle_wpscan_err(p)
         else:
             return p
@@ -142,10 +154,7 @@ class WPScanWrapper:
         else:
             self._lazy_last_db_update = None
         
-        try:
-            self._lazy_wpscan_version = version_info['version']
-        except KeyError:
-            self._lazy_wpscan_version = None
+        self._lazy_wpscan_version = version_info.get("version")
 
     def _update_wpscan(self) -> None:
         # Update wpscan database
@@ -175,7 +184,8 @@ class WPScanWrapper:
             arguments.pop(0)
         cmd = self._wpscan_path + arguments
         # Log wpscan command without api token
-        log.debug(f"Running WPScan command: {' '.join(safe_log_wpscan_args(cmd))}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Running WPScan command: {' '.join(safe_log_wpscan_args(cmd))}")
         # Run wpscan
         process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         # Append process to current process list and launch
@@ -225,9 +235,8 @@ class WPScanWrapper:
         """Parse URL in WPScan output and retry. 
         """
         if "The URL supplied redirects to" in failed_process.stdout:
-            urls = re.findall(
-                r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
-                failed_process.stdout.split("The URL supplied redirects to")[1],
+            urls = _URL_RE.findall(
+                failed_process.stdout.split("The URL supplied redirects to")[1]
             )
 
             if len(urls) >= 1: